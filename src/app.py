@@ -19,61 +19,62 @@ current_dir = Path(__file__).parent
 app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
           "static")), name="static")
 
-# In-memory activity database
+# In-memory activity database; participants are insertion-ordered dicts
+# (emails as keys) for O(1) membership checks that keep signup order
 activities = {
     "Soccer Team": {
         "description": "Join our competitive soccer team and participate in inter-school matches",
         "schedule": "Tuesdays and Thursdays, 4:00 PM - 5:30 PM",
         "max_participants": 25,
-        "participants": ["alex@mergington.edu", "sarah@mergington.edu"]
+        "participants": dict.fromkeys(["alex@mergington.edu", "sarah@mergington.edu"])
         },
         "Basketball Club": {
         "description": "Practice basketball skills and compete in tournaments",
         "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
         "max_participants": 15,
-        "participants": ["james@mergington.edu", "emily@mergington.edu"]
+        "participants": dict.fromkeys(["james@mergington.edu", "emily@mergington.edu"])
         },
         "Art Studio": {
         "description": "Explore various art mediums including painting, drawing, and sculpture",
         "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
         "max_participants": 15,
-        "participants": ["lily@mergington.edu", "noah@mergington.edu"]
+        "participants": dict.fromkeys(["lily@mergington.edu", "noah@mergington.edu"])
         },
         "Drama Club": {
         "description": "Perform in plays and musicals, develop acting and stage skills",
         "schedule": "Mondays and Thursdays, 3:30 PM - 5:00 PM",
         "max_participants": 20,
-        "participants": ["ava@mergington.edu", "william@mergington.edu"]
+        "participants": dict.fromkeys(["ava@mergington.edu", "william@mergington.edu"])
         },
         "Debate Team": {
         "description": "Develop critical thinking and public speaking through competitive debates",
         "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
         "max_participants": 16,
-        "participants": ["mia@mergington.edu", "ethan@mergington.edu"]
+        "participants": dict.fromkeys(["mia@mergington.edu", "ethan@mergington.edu"])
         },
         "Science Olympiad": {
         "description": "Compete in science competitions and conduct exciting experiments",
         "schedule": "Thursdays, 3:30 PM - 5:00 PM",
         "max_participants": 18,
-        "participants": ["isabella@mergington.edu", "lucas@mergington.edu"]
+        "participants": dict.fromkeys(["isabella@mergington.edu", "lucas@mergington.edu"])
         },
     "Chess Club": {
         "description": "Learn strategies and compete in chess tournaments",
         "schedule": "Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+        "participants": dict.fromkeys(["michael@mergington.edu", "daniel@mergington.edu"])
     },
     "Programming Class": {
         "description": "Learn programming fundamentals and build software projects",
         "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
         "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+        "participants": dict.fromkeys(["emma@mergington.edu", "sophia@mergington.edu"])
     },
     "Gym Class": {
         "description": "Physical education and sports activities",
         "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
         "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+        "participants": dict.fromkeys(["john@mergington.edu", "olivia@mergington.edu"])
     }
 }
 
@@ -84,39 +85,40 @@ def root():
 
 
 @app.get("/activities")
-def get_activities():
-    return activities
+def get_activities() -> dict[str, dict]:
+    return {
+        name: {**activity, "participants": list(activity["participants"])}
+        for name, activity in activities.items()
+    }
 
 
 @app.post("/activities/{activity_name}/signup")
-def signup_for_activity(activity_name: str, email: str):
+def signup_for_activity(activity_name: str, email: str) -> dict[str, str]:
     """Sign up a student for an activity"""
-    # Validate activity exists
-    if activity_name not in activities:
+    # Get the specific activity, validating it exists
+    activity = activities.get(activity_name)
+    if activity is None:
         raise HTTPException(status_code=404, detail="Activity not found")
 
-    # Get the specific activity
-    activity = activities[activity_name]
     # Validate student is not already signed up
     if email in activity["participants"]:
         raise HTTPException(status_code=400, detail="Student already signed up for this activity")
     # Add student
-    activity["participants"].append(email)
+    activity["participants"][email] = None
     return {"message": f"Signed up {email} for {activity_name}"}
 
 
 @app.delete("/activities/{activity_name}/unregister")
-def unregister_from_activity(activity_name: str, email: str):
+def unregister_from_activity(activity_name: str, email: str) -> dict[str, str]:
     """Unregister a student from an activity"""
-    # Validate activity exists
-    if activity_name not in activities:
+    # Get the specific activity, validating it exists
+    activity = activities.get(activity_name)
+    if activity is None:
         raise HTTPException(status_code=404, detail="Activity not found")
 
-    # Get the specific activity
-    activity = activities[activity_name]
     # Validate student is registered
     if email not in activity["participants"]:
         raise HTTPException(status_code=400, detail="Student is not registered for this activity")
     # Remove student
-    activity["participants"].remove(email)
+    del activity["participants"][email]
     return {"message": f"Unregistered {email} from {activity_name}"}
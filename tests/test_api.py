@@ -1,82 +1,145 @@
 """
 Tests for the Mergington High School API
 """
+import sys
+from types import MappingProxyType
+
+import orjson
 import pytest
 from fastapi.testclient import TestClient
 from src.app import app, activities
 
+# Interned activity names shared by the template, requests and assertions
+SOCCER = sys.intern("Soccer Team")
+BASKETBALL = sys.intern("Basketball Club")
+ART = sys.intern("Art Studio")
+DRAMA = sys.intern("Drama Club")
+DEBATE = sys.intern("Debate Team")
+SCIENCE = sys.intern("Science Olympiad")
+CHESS = sys.intern("Chess Club")
+PROGRAMMING = sys.intern("Programming Class")
+GYM = sys.intern("Gym Class")
 
-@pytest.fixture
+# Endpoint URL builders; httpx percent-encodes the path and query params
+SIGNUP_URL = "/activities/{}/signup".format
+UNREGISTER_URL = "/activities/{}/unregister".format
+
+
+def get_activity_via_api(client, name):
+    """Fetch a single activity's details from GET /activities"""
+    return orjson.loads(client.get("/activities").content)[name]
+
+
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
+    """Create a test client for the FastAPI app, shared across the session"""
+    # Not entered as a context manager: the app has no startup/shutdown
+    # handlers, so running its lifespan would only spin up an unused portal
+    test_client = TestClient(app)
+    yield test_client
+    test_client.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warmup(client):
+    """Build the route table and middleware stack once before the first test"""
+    client.get("/activities")
+
+
+# Pristine activity data restored around each mutating test; the template
+# and each activity entry are read-only and participants are tuples, so a
+# test cannot accidentally corrupt the template itself
+_ORIGINAL_ACTIVITIES = MappingProxyType({
+    SOCCER: MappingProxyType({
+        "description": "Join our competitive soccer team and participate in inter-school matches",
+        "schedule": "Tuesdays and Thursdays, 4:00 PM - 5:30 PM",
+        "max_participants": 25,
+        "participants": ("alex@mergington.edu", "sarah@mergington.edu")
+    }),
+    BASKETBALL: MappingProxyType({
+        "description": "Practice basketball skills and compete in tournaments",
+        "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
+        "max_participants": 15,
+        "participants": ("james@mergington.edu", "emily@mergington.edu")
+    }),
+    ART: MappingProxyType({
+        "description": "Explore various art mediums including painting, drawing, and sculpture",
+        "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
+        "max_participants": 15,
+        "participants": ("lily@mergington.edu", "noah@mergington.edu")
+    }),
+    DRAMA: MappingProxyType({
+        "description": "Perform in plays and musicals, develop acting and stage skills",
+        "schedule": "Mondays and Thursdays, 3:30 PM - 5:00 PM",
+        "max_participants": 20,
+        "participants": ("ava@mergington.edu", "william@mergington.edu")
+    }),
+    DEBATE: MappingProxyType({
+        "description": "Develop critical thinking and public speaking through competitive debates",
+        "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
+        "max_participants": 16,
+        "participants": ("mia@mergington.edu", "ethan@mergington.edu")
+    }),
+    SCIENCE: MappingProxyType({
+        "description": "Compete in science competitions and conduct exciting experiments",
+        "schedule": "Thursdays, 3:30 PM - 5:00 PM",
+        "max_participants": 18,
+        "participants": ("isabella@mergington.edu", "lucas@mergington.edu")
+    }),
+    CHESS: MappingProxyType({
+        "description": "Learn strategies and compete in chess tournaments",
+        "schedule": "Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 12,
+        "participants": ("michael@mergington.edu", "daniel@mergington.edu")
+    }),
+    PROGRAMMING: MappingProxyType({
+        "description": "Learn programming fundamentals and build software projects",
+        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+        "max_participants": 20,
+        "participants": ("emma@mergington.edu", "sophia@mergington.edu")
+    }),
+    GYM: MappingProxyType({
+        "description": "Physical education and sports activities",
+        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+        "max_participants": 30,
+        "participants": ("john@mergington.edu", "olivia@mergington.edu")
+    })
+})
+
+# Names of every activity the API is expected to return
+EXPECTED_ACTIVITIES = frozenset(_ORIGINAL_ACTIVITIES)
+
+
+def _fresh_activity(original):
+    """Build a mutable copy of a template activity entry"""
+    return {**original, "participants": dict.fromkeys(original["participants"])}
+
+
+def _restore_activities():
+    """Reset activities data to the pristine template"""
+    # Activities added, removed or reordered: rebuild the whole dict
+    if list(activities) != list(_ORIGINAL_ACTIVITIES):
+        activities.clear()
+        activities.update({
+            name: _fresh_activity(original)
+            for name, original in _ORIGINAL_ACTIVITIES.items()
+        })
+        return
+    # Otherwise replace only the entries that differ from the template,
+    # comparing participants as tuples so their order counts too
+    for name, original in _ORIGINAL_ACTIVITIES.items():
+        activity = activities[name]
+        participants = tuple(activity.get("participants", ()))
+        if {**activity, "participants": participants} != original:
+            activities[name] = _fresh_activity(original)
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture
 def reset_activities():
-    """Reset activities data before each test"""
-    # Store original data
-    original_activities = {
-        "Soccer Team": {
-            "description": "Join our competitive soccer team and participate in inter-school matches",
-            "schedule": "Tuesdays and Thursdays, 4:00 PM - 5:30 PM",
-            "max_participants": 25,
-            "participants": ["alex@mergington.edu", "sarah@mergington.edu"]
-        },
-        "Basketball Club": {
-            "description": "Practice basketball skills and compete in tournaments",
-            "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
-            "max_participants": 15,
-            "participants": ["james@mergington.edu", "emily@mergington.edu"]
-        },
-        "Art Studio": {
-            "description": "Explore various art mediums including painting, drawing, and sculpture",
-            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 15,
-            "participants": ["lily@mergington.edu", "noah@mergington.edu"]
-        },
-        "Drama Club": {
-            "description": "Perform in plays and musicals, develop acting and stage skills",
-            "schedule": "Mondays and Thursdays, 3:30 PM - 5:00 PM",
-            "max_participants": 20,
-            "participants": ["ava@mergington.edu", "william@mergington.edu"]
-        },
-        "Debate Team": {
-            "description": "Develop critical thinking and public speaking through competitive debates",
-            "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 16,
-            "participants": ["mia@mergington.edu", "ethan@mergington.edu"]
-        },
-        "Science Olympiad": {
-            "description": "Compete in science competitions and conduct exciting experiments",
-            "schedule": "Thursdays, 3:30 PM - 5:00 PM",
-            "max_participants": 18,
-            "participants": ["isabella@mergington.edu", "lucas@mergington.edu"]
-        },
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        }
-    }
-    
-    # Reset to original state
-    activities.clear()
-    activities.update(original_activities)
+    """Reset activities data before and after a test that mutates it"""
+    _restore_activities()
     yield
+    _restore_activities()
 
 
 class TestRootEndpoint:
@@ -96,63 +159,60 @@ class TestGetActivities:
         """Test that GET /activities returns all activities"""
         response = client.get("/activities")
         assert response.status_code == 200
-        data = response.json()
-        assert len(data) == 9
-        assert "Soccer Team" in data
-        assert "Basketball Club" in data
-        assert "Programming Class" in data
+        data = orjson.loads(response.content)
+        assert data.keys() == EXPECTED_ACTIVITIES
     
-    def test_activities_have_correct_structure(self, client):
+    @pytest.mark.parametrize("name", list(_ORIGINAL_ACTIVITIES))
+    def test_activities_have_correct_structure(self, client, name):
         """Test that each activity has the required fields"""
-        response = client.get("/activities")
-        data = response.json()
+        activity = get_activity_via_api(client, name)
         
-        for activity_name, activity in data.items():
-            assert "description" in activity
-            assert "schedule" in activity
-            assert "max_participants" in activity
-            assert "participants" in activity
-            assert isinstance(activity["participants"], list)
-            assert isinstance(activity["max_participants"], int)
+        assert "description" in activity
+        assert "schedule" in activity
+        assert "max_participants" in activity
+        assert "participants" in activity
+        assert isinstance(activity["participants"], list)
+        assert isinstance(activity["max_participants"], int)
 
 
+@pytest.mark.usefixtures("reset_activities")
 class TestSignupForActivity:
     """Tests for POST /activities/{activity_name}/signup endpoint"""
     
-    def test_signup_new_student_success(self, client):
+    @pytest.mark.parametrize("activity", list(_ORIGINAL_ACTIVITIES))
+    def test_signup_new_student_success(self, client, activity):
         """Test successful signup for a new student"""
         response = client.post(
-            "/activities/Soccer%20Team/signup?email=newstudent@mergington.edu"
+            SIGNUP_URL(activity), params={"email": "newstudent@mergington.edu"}
         )
         assert response.status_code == 200
-        data = response.json()
+        data = orjson.loads(response.content)
         assert "message" in data
         assert "newstudent@mergington.edu" in data["message"]
-        assert "Soccer Team" in data["message"]
+        assert activity in data["message"]
         
         # Verify the student was added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "newstudent@mergington.edu" in activities_data["Soccer Team"]["participants"]
+        assert "newstudent@mergington.edu" in activities[activity]["participants"]
     
-    def test_signup_duplicate_student_fails(self, client):
+    @pytest.mark.parametrize("activity", list(_ORIGINAL_ACTIVITIES))
+    def test_signup_duplicate_student_fails(self, client, activity):
         """Test that signing up the same student twice fails"""
-        email = "alex@mergington.edu"  # Already in Soccer Team
+        email = _ORIGINAL_ACTIVITIES[activity]["participants"][0]
         response = client.post(
-            f"/activities/Soccer%20Team/signup?email={email}"
+            SIGNUP_URL(activity), params={"email": email}
         )
         assert response.status_code == 400
-        data = response.json()
+        data = orjson.loads(response.content)
         assert "detail" in data
         assert "already signed up" in data["detail"].lower()
     
     def test_signup_nonexistent_activity_fails(self, client):
         """Test that signing up for a non-existent activity fails"""
         response = client.post(
-            "/activities/Nonexistent%20Activity/signup?email=student@mergington.edu"
+            SIGNUP_URL("Nonexistent Activity"), params={"email": "student@mergington.edu"}
         )
         assert response.status_code == 404
-        data = response.json()
+        data = orjson.loads(response.content)
         assert "detail" in data
         assert "not found" in data["detail"].lower()
     
@@ -162,111 +222,109 @@ class TestSignupForActivity:
         
         # Sign up for Soccer Team
         response1 = client.post(
-            f"/activities/Soccer%20Team/signup?email={email}"
+            SIGNUP_URL(SOCCER), params={"email": email}
         )
         assert response1.status_code == 200
         
         # Sign up for Basketball Club
         response2 = client.post(
-            f"/activities/Basketball%20Club/signup?email={email}"
+            SIGNUP_URL(BASKETBALL), params={"email": email}
         )
         assert response2.status_code == 200
         
         # Verify both signups
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email in activities_data["Soccer Team"]["participants"]
-        assert email in activities_data["Basketball Club"]["participants"]
+        assert email in activities[SOCCER]["participants"]
+        assert email in activities[BASKETBALL]["participants"]
+    
+    def test_signup_preserves_participant_order(self, client):
+        """Test that GET /activities lists participants in signup order"""
+        emails = ["zed@mergington.edu", "bob@mergington.edu", "ann@mergington.edu"]
+        for email in emails:
+            client.post(SIGNUP_URL(ART), params={"email": email})
+        
+        activity = get_activity_via_api(client, ART)
+        assert activity["participants"] == [*_ORIGINAL_ACTIVITIES[ART]["participants"], *emails]
 
 
+@pytest.mark.usefixtures("reset_activities")
 class TestUnregisterFromActivity:
     """Tests for DELETE /activities/{activity_name}/unregister endpoint"""
     
-    def test_unregister_existing_student_success(self, client):
+    @pytest.mark.parametrize("activity", list(_ORIGINAL_ACTIVITIES))
+    def test_unregister_existing_student_success(self, client, activity):
         """Test successful unregistration of an existing student"""
-        email = "alex@mergington.edu"  # Already in Soccer Team
+        email = _ORIGINAL_ACTIVITIES[activity]["participants"][0]
         response = client.delete(
-            f"/activities/Soccer%20Team/unregister?email={email}"
+            UNREGISTER_URL(activity), params={"email": email}
         )
         assert response.status_code == 200
-        data = response.json()
+        data = orjson.loads(response.content)
         assert "message" in data
         assert email in data["message"]
-        assert "Soccer Team" in data["message"]
+        assert activity in data["message"]
         
         # Verify the student was removed
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email not in activities_data["Soccer Team"]["participants"]
+        assert email not in activities[activity]["participants"]
     
     def test_unregister_non_registered_student_fails(self, client):
         """Test that unregistering a student not in the activity fails"""
         email = "notregistered@mergington.edu"
         response = client.delete(
-            f"/activities/Soccer%20Team/unregister?email={email}"
+            UNREGISTER_URL(SOCCER), params={"email": email}
         )
         assert response.status_code == 400
-        data = response.json()
+        data = orjson.loads(response.content)
         assert "detail" in data
         assert "not registered" in data["detail"].lower()
     
     def test_unregister_from_nonexistent_activity_fails(self, client):
         """Test that unregistering from a non-existent activity fails"""
         response = client.delete(
-            "/activities/Nonexistent%20Activity/unregister?email=student@mergington.edu"
+            UNREGISTER_URL("Nonexistent Activity"), params={"email": "student@mergington.edu"}
         )
         assert response.status_code == 404
-        data = response.json()
+        data = orjson.loads(response.content)
         assert "detail" in data
         assert "not found" in data["detail"].lower()
     
-    def test_signup_then_unregister_then_signup_again(self, client):
+    @pytest.mark.parametrize("activity", list(_ORIGINAL_ACTIVITIES))
+    def test_signup_then_unregister_then_signup_again(self, client, activity):
         """Test the full cycle: signup, unregister, signup again"""
         email = "cycletest@mergington.edu"
-        activity = "Chess Club"
+        params = {"email": email}
+        signup_url = SIGNUP_URL(activity)
+        unregister_url = UNREGISTER_URL(activity)
         
-        # Initial signup
-        response1 = client.post(
-            f"/activities/{activity.replace(' ', '%20')}/signup?email={email}"
-        )
-        assert response1.status_code == 200
-        
-        # Unregister
-        response2 = client.delete(
-            f"/activities/{activity.replace(' ', '%20')}/unregister?email={email}"
-        )
-        assert response2.status_code == 200
-        
-        # Signup again
-        response3 = client.post(
-            f"/activities/{activity.replace(' ', '%20')}/signup?email={email}"
-        )
-        assert response3.status_code == 200
-        
-        # Verify final state
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email in activities_data[activity]["participants"]
+        # Each step must succeed and leave the expected membership behind
+        steps = [
+            (client.post, signup_url, True),
+            (client.delete, unregister_url, False),
+            (client.post, signup_url, True),
+        ]
+        for request, url, registered in steps:
+            response = request(url, params=params)
+            assert response.status_code == 200
+            assert (email in activities[activity]["participants"]) is registered
 
 
 class TestActivityCapacity:
     """Tests for activity capacity limits"""
     
-    def test_activity_tracks_participants_correctly(self, client):
+    @pytest.mark.parametrize("name", list(_ORIGINAL_ACTIVITIES))
+    def test_activity_tracks_participants_correctly(self, client, name):
         """Test that participant count is tracked correctly"""
-        response = client.get("/activities")
-        data = response.json()
+        activity = get_activity_via_api(client, name)
         
-        soccer_team = data["Soccer Team"]
-        initial_count = len(soccer_team["participants"])
-        max_participants = soccer_team["max_participants"]
+        initial_count = len(activity["participants"])
+        max_participants = activity["max_participants"]
         
         # Verify spots calculation would be correct
         spots_left = max_participants - initial_count
         assert spots_left > 0
-        assert initial_count == 2  # alex and sarah
+        assert initial_count == len(_ORIGINAL_ACTIVITIES[name]["participants"])
 
 
+@pytest.mark.usefixtures("reset_activities")
 class TestDataPersistence:
     """Tests for data persistence within a session"""
     
@@ -275,17 +333,17 @@ class TestDataPersistence:
         email = "persistent@mergington.edu"
         
         # Add student
-        client.post(f"/activities/Art%20Studio/signup?email={email}")
+        client.post(SIGNUP_URL(ART), params={"email": email})
         
         # Make another request and verify student is still there
         response = client.get("/activities")
-        data = response.json()
-        assert email in data["Art Studio"]["participants"]
+        data = orjson.loads(response.content)
+        assert email in data[ART]["participants"]
         
         # Remove student
-        client.delete(f"/activities/Art%20Studio/unregister?email={email}")
+        client.delete(UNREGISTER_URL(ART), params={"email": email})
         
         # Verify student is gone
         response = client.get("/activities")
-        data = response.json()
-        assert email not in data["Art Studio"]["participants"]
+        data = orjson.loads(response.content)
+        assert email not in data[ART]["participants"]